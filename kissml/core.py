@@ -1,5 +1,8 @@
+import threading
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from hashlib import sha256
+from pathlib import Path
 from typing import Any
 
 from diskcache import Cache
@@ -54,32 +57,107 @@ def create_cache_key(**kwargs: dict[str, Any]) -> OrderedDict:
     return hashes
 
 
-_caches: dict[tuple[str, EvictionPolicy, str | None], Cache] = {}
+def create_cache_digest(version: int, /, **kwargs: Any) -> bytes:
+    """
+    Creates a compact cache key from a version and keyword arguments.
+
+    The version and the per-argument hashes from `create_cache_key` are folded
+    into a single SHA256 digest. DiskCache stores bytes keys as they are,
+    without pickling them, so lookups by digest are cheaper than by a tuple.
+
+    Args:
+        version: The cache version; changing it changes every key
+        **kwargs: Arbitrary keyword arguments to hash, as for
+            `create_cache_key`.
+
+    Returns:
+        The 32-byte digest to use as the cache key.
+
+    Example:
+        >>> key = create_cache_digest(1, a=1, b="test")
+        >>> cache.set(key, result)
+    """
+    hashes = create_cache_key(**kwargs)
+    h = sha256(version.to_bytes(8, "big", signed=True))
+    h.update(repr(list(hashes.items())).encode())
+    return h.digest()
+
+
+_caches: dict[tuple[Path, str, EvictionPolicy, str | None], Cache] = {}
+
+# Guards opening caches, which may also happen on the warmup thread
+_caches_lock = threading.Lock()
+
+# Bumped by close_all_caches, so code holding on to a Cache from get_cache
+# knows to look it up again
+_generation = 0
+
+# Opens caches in the background for steps configured with warmup=True
+_warmup_executor: ThreadPoolExecutor | None = None
+_warmups: set[Future] = set()
 
 
 def get_cache(
     function_name: str, eviction_policy: EvictionPolicy, namespace: str | None
 ) -> Cache:
     global _caches
-    key = (function_name, eviction_policy, namespace)
-    if key not in _caches:
-        cache_directory = (
-            settings.cache_directory
-            / (namespace or "")
-            / function_name
-            / eviction_policy.value
-        )
-        _caches[key] = Cache(
-            directory=str(cache_directory),
-            eviction_policy=eviction_policy.value,
-            disk=TypeRoutingDisk,
-        )
+    # Keyed by directory too, so a cache opened before the directory was
+    # configured (e.g. by a warmup) isn't used for the new one
+    key = (settings.cache_directory, function_name, eviction_policy, namespace)
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                cache_directory = (
+                    settings.cache_directory
+                    / (namespace or "")
+                    / function_name
+                    / eviction_policy
+                )
+                cache = Cache(
+                    directory=str(cache_directory),
+                    eviction_policy=eviction_policy,
+                    disk=TypeRoutingDisk,
+                )
+                _caches[key] = cache
+
+    return cache
+
+
+def warm_cache(
+    function_name: str, eviction_policy: EvictionPolicy, namespace: str | None
+) -> Future:
+    """
+    Open a cache on a background thread, ahead of its first use.
+
+    Creating a cache sets up its directory and SQLite database, which can take
+    tens of milliseconds. Warming it lets that happen while the program does
+    other work; `get_cache` waits for a warmup that's still in progress.
 
-    return _caches[key]
+    Returns:
+        A future resolving to the Cache returned by `get_cache`.
+    """
+    global _warmup_executor
+    with _caches_lock:
+        if _warmup_executor is None:
+            _warmup_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="kissml-warmup"
+            )
+        future = _warmup_executor.submit(
+            get_cache, function_name, eviction_policy, namespace
+        )
+        _warmups.add(future)
+    future.add_done_callback(_warmups.discard)
+    return future
 
 
 def close_all_caches():
-    global _caches
-    for cache in _caches.values():
-        cache.close()
-    _caches.clear()
+    global _caches, _generation
+    # Let pending warmups finish so they can't reopen a cache afterwards
+    wait(list(_warmups))
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+        _generation += 1
@@ -1,6 +1,7 @@
 import importlib
 import os
-from pathlib import Path
+from functools import lru_cache
+from typing import BinaryIO
 
 from diskcache import UNKNOWN, Disk
 from diskcache.core import MODE_BINARY
@@ -8,11 +9,13 @@ from diskcache.core import MODE_BINARY
 from kissml.settings import settings
 
 
+@lru_cache(maxsize=1024)
 def _type_to_str(t: type) -> str:
     """Convert a type to a fully-qualified string representation."""
     return f"{t.__module__}.{t.__qualname__}"
 
 
+@lru_cache(maxsize=1024)
 def _str_to_type(type_str: str) -> type | None:
     """
     Convert a fully-qualified type string back to a type object.
@@ -39,13 +42,41 @@ def _str_to_type(type_str: str) -> type | None:
         return None
 
 
+def _open_for_write(full_path: str) -> BinaryIO:
+    """
+    Open a cache file for writing, creating its directory only if missing.
+
+    Most stores land in a sub-directory that already exists, so trying the
+    open first saves a mkdir call per store.
+    """
+    try:
+        return open(full_path, "wb")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        return open(full_path, "wb")
+
+
+def _read_file(path: str) -> memoryview:
+    """
+    Read a cache file into a single writable buffer.
+
+    The file is closed before returning, so values built on top of the
+    buffer don't hold a file descriptor (unlike a memory map, which stays
+    open for as long as anything references it) and stay writable without
+    modifying the file.
+    """
+    with open(path, "rb") as f:
+        data = bytearray(os.fstat(f.fileno()).st_size)
+        return memoryview(data)[: f.readinto(data)]
+
+
 class TypeRoutingDisk(Disk):
     """
     Custom DiskCache Disk implementation that routes values to type-specific serializers.
 
     This class extends DiskCache's Disk to support pluggable serialization strategies
     based on value type. Types registered in settings.serialize_by_type use their
-    custom serializers (e.g., Parquet for DataFrames), while other types fall back
+    custom serializers (e.g., Arrow IPC for DataFrames), while other types fall back
     to DiskCache's default pickle serialization.
 
     The type information is stored in the cache database's value column as a
@@ -56,32 +87,34 @@ class TypeRoutingDisk(Disk):
         >>> from kissml.settings import settings
         >>> from kissml.serializers import PandasSerializer
         >>> settings.serialize_by_type[pd.DataFrame] = PandasSerializer()
-        >>> # Now all DataFrames will be cached as Parquet files
+        >>> # Now all DataFrames will be cached as Arrow IPC files
     """
 
+    def __init__(self, directory, **kwargs):
+        super().__init__(directory, **kwargs)
+        # Fetches join this with a relative filename by plain concatenation,
+        # which is much cheaper than building a Path per call
+        self._directory_prefix = os.path.join(directory, "")
+
     def store(self, value, read, key=UNKNOWN):
         value_type = type(value)
 
         # Use any registered custom serializers
-        if value_type in settings.serialize_by_type:
-            serializer = settings.serialize_by_type[value_type]
-
+        serializer = settings.serialize_by_type.get(value_type)
+        if serializer is not None and serializer.accepts(value):
             # Create a filename using diskcache's existing logic
             filename, full_path = self.filename(value=value)
 
-            # Ensure directory exists
-            Path(full_path).parent.mkdir(parents=True, exist_ok=True)
-
             # Open file and serialize
-            with open(full_path, "wb") as f:
+            with _open_for_write(full_path) as f:
                 serializer.serialize(value, f)
 
+                # The end offset is the size on disk; no need to stat it
+                file_size = f.seek(0, os.SEEK_END)
+
             # Compute type string for lookup
             type_str = _type_to_str(value_type)
 
-            # Compute the size on disk
-            file_size = os.path.getsize(full_path)
-
             # Return (size, mode, filename, value) tuple for Cache table
             # For `value`, we'll use the type of the value so we can lookup later
             # We'll use `MODE_BINARY` for all serializers
@@ -91,17 +124,16 @@ class TypeRoutingDisk(Disk):
             return super().store(value, read, key)
 
     def fetch(self, mode, filename, value, read):
-        value_type = _str_to_type(value)
-        if (
-            mode == MODE_BINARY
-            and value_type is not None
-            and value_type in settings.serialize_by_type
-        ):
-            serializer = settings.serialize_by_type[value_type]
-            path = Path(self._directory) / filename
-
-            # Open file and deserialize
-            with open(path, "rb") as f:
-                return serializer.deserialize(f)
+        # Only resolve the type string for entries our serializers wrote
+        value_type = _str_to_type(value) if mode == MODE_BINARY else None
+        serializer = (
+            settings.serialize_by_type.get(value_type)
+            if value_type is not None
+            else None
+        )
+        if serializer is not None:
+            # Read the file in one go and deserialize from the buffer
+            path = self._directory_prefix + filename
+            return serializer.deserialize_bytes(_read_file(path))
         else:
             return super().fetch(mode, filename, value, read)
@@ -1,29 +1,86 @@
 import json
 import pickle
+import struct
+from collections.abc import Iterable
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, BinaryIO
 
-import numpy as np
-
 if TYPE_CHECKING:
     pass
 
 from kissml.types import Serializer
 
+# Leading magic bytes of a Parquet file
+_PARQUET_MAGIC = b"PAR1"
+
+# Protocol used for manifests and pickled elements. Pinned rather than
+# pickle.HIGHEST_PROTOCOL, so a newer interpreter doesn't write entries older
+# ones can't read; 5 is also the first with out-of-band buffers. pickle.load
+# detects the protocol on its own, so older entries still load.
+_PICKLE_PROTOCOL = 5
+
+# 8-byte big-endian length prefix used to frame collection elements
+_LENGTH = struct.Struct(">Q")
+_pack_length = _LENGTH.pack
+_unpack_length = _LENGTH.unpack
+
+# Bytes _BufferReader.readline scans at a time while looking for a newline
+_READLINE_CHUNK = 256
+
+# Header of ndarray cells packed by PandasSerializer: format marker, dtype
+# string length and number of dimensions. Cells written with np.save start
+# with _NPY_MAGIC instead.
+_NDARRAY_HEADER = struct.Struct(">BBB")
+_NDARRAY_FORMAT = 1
+_NPY_MAGIC = b"\x93"
+
+# Format version of the collection serializers, stored in their manifest.
+# Version 1 manifests are bare lists of types; version 2 adds out-of-band
+# pickle buffers after each pickled element; version 3 stores the manifest
+# of a homogeneous collection as a single type and a count; version 4 lets an
+# entry be the index of an earlier element that is the same object.
+_FORMAT_VERSION = 4
+
 
 class PandasSerializer(Serializer):
     """
-    Serializer for pandas DataFrames using Parquet format.
-
-    Uses pandas' built-in Parquet support (requires pyarrow or fastparquet).
-    Parquet provides efficient columnar storage with compression, making it
-    ideal for caching large DataFrames.
+    Serializer for pandas DataFrames using the Arrow IPC file format (Feather v2).
+
+    Requires pyarrow. Unlike Parquet, Arrow IPC stores columns in Arrow's
+    in-memory layout, so reading a cached DataFrame back is a single read and
+    a conversion to pandas rather than a full decode. Entries written by older
+    versions in Parquet format are still readable.
+
+    Args:
+        strict_detection: If True, scan every cell of object columns when
+            looking for ndarray cells. By default only the first non-null
+            cell of each object column is inspected.
+        compression: Optional codec for the Arrow record batches, "lz4" or
+            "zstd". Defaults to None, which skips decompression on reads; "lz4"
+            trades a little CPU for less disk I/O, and "zstd" compresses
+            further at a higher CPU cost. Readers detect the codec
+            automatically, so this can be changed without invalidating
+            existing entries.
+        compression_level: Optional codec-specific level, e.g. 1-22 for
+            "zstd". Defaults to the codec's own default.
 
     Raises:
         ValueError: If the value is not a pandas DataFrame.
     """
 
+    def __init__(
+        self,
+        strict_detection: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ):
+        self.strict_detection = strict_detection
+        self.compression = compression
+        self.compression_level = compression_level
+
     def _ndarray_to_bytes(self, arr: Any) -> bytes | None:
+        import numpy as np
+
         if arr is None:
             return None
         if not isinstance(arr, np.ndarray):
@@ -46,20 +103,69 @@ class PandasSerializer(Serializer):
             and all(isinstance(x, str) for x in arr.flat)
         ):
             arr = arr.astype(str)
-        buffer = BytesIO()
-        np.save(buffer, arr, allow_pickle=False)
-        buffer.seek(0)
-        return buffer.read()
+        if arr.dtype.hasobject or arr.dtype.names is not None:
+            # Let numpy handle (or reject) object and structured dtypes
+            buffer = BytesIO()
+            np.save(buffer, arr, allow_pickle=False)
+            return buffer.getvalue()
+        # Compact header of dtype and shape instead of numpy's padded one
+        dtype = arr.dtype.str.encode()
+        return b"".join(
+            (
+                _NDARRAY_HEADER.pack(_NDARRAY_FORMAT, len(dtype), arr.ndim),
+                dtype,
+                struct.pack(f">{arr.ndim}Q", *arr.shape),
+                arr.tobytes(),
+            )
+        )
 
     def _bytes_to_ndarray(self, b: bytes | None) -> Any:
+        import numpy as np
+
         if b is None:
             return None
-        buffer = BytesIO(b)
-        return np.load(buffer, allow_pickle=False)
+        if b[:1] == _NPY_MAGIC:
+            # Written with np.save
+            return np.load(BytesIO(b), allow_pickle=False)
+        _, dtype_length, ndim = _NDARRAY_HEADER.unpack_from(b)
+        offset = _NDARRAY_HEADER.size
+        dtype = np.dtype(b[offset : offset + dtype_length].decode())
+        offset += dtype_length
+        shape = struct.unpack_from(f">{ndim}Q", b, offset)
+        offset += 8 * ndim
+        # Copy so the array is writable, like one returned by np.load
+        return (
+            np.frombuffer(b, dtype=dtype, offset=offset).reshape(shape).copy()
+        )
+
+    def ndarray_columns(self, df) -> list:
+        """
+        Return the names of columns holding numpy arrays as cell values.
+
+        Only the first non-null cell of each object column is checked, unless
+        `strict_detection` is set. ndarray columns may only mix arrays with
+        missing values, so the first valid cell is representative.
+        """
+        import numpy as np
+
+        columns = []
+        for col, series in df.items():
+            if series.dtype != object:
+                continue
+            if self.strict_detection:
+                if any(isinstance(item, np.ndarray) for item in series):
+                    columns.append(col)
+                continue
+            valid = series.notna().to_numpy()
+            if valid.any() and isinstance(
+                series.iloc[valid.argmax()], np.ndarray
+            ):
+                columns.append(col)
+        return columns
 
     def to_packed_dataframe(self, df):
         """
-        Convert a DataFrame with ndarray columns to a packed format suitable for Parquet storage.
+        Convert a DataFrame with ndarray columns to a packed format suitable for Arrow storage.
         """
         import pandas as pd
 
@@ -68,21 +174,18 @@ class PandasSerializer(Serializer):
                 "PandasSerializer can only serialize data frames."
             )
 
-        columns_with_ndarrays = [
-            col
-            for col in df.columns
-            if any(isinstance(item, np.ndarray) for item in df[col])
-        ]
+        columns_with_ndarrays = self.ndarray_columns(df)
 
-        # Create a copy to avoid modifying the original
-        df = df.copy()
+        # Create a copy to avoid modifying the original. Packed columns are
+        # replaced wholesale, so the other columns' data can be shared.
+        if columns_with_ndarrays:
+            df = df.copy(deep=False)
         for col in columns_with_ndarrays:
             df[col] = df[col].apply(self._ndarray_to_bytes)
         return df, columns_with_ndarrays
 
     def serialize(self, value: Any, out: BinaryIO) -> None:
         import pyarrow as pa
-        import pyarrow.parquet as pq
 
         df, columns_with_ndarrays = self.to_packed_dataframe(value)
 
@@ -95,20 +198,64 @@ class PandasSerializer(Serializer):
                 b"serializer_metadata": json.dumps(metadata).encode(),
             }
         )
-        pq.write_table(table, out)
+        codec = (
+            pa.Codec(
+                self.compression, compression_level=self.compression_level
+            )
+            if self.compression is not None
+            else None
+        )
+        options = pa.ipc.IpcWriteOptions(compression=codec)
+        with pa.ipc.new_file(out, table.schema, options=options) as writer:
+            writer.write_table(table)
 
     def deserialize(self, input: BinaryIO) -> Any:
+        import pyarrow as pa
         import pyarrow.parquet as pq
 
-        table = pq.read_table(input)
-        df = table.to_pandas()
+        # Entries written before the switch to Arrow IPC are Parquet files
+        start = input.tell()
+        is_parquet = input.read(len(_PARQUET_MAGIC)) == _PARQUET_MAGIC
+        input.seek(start)
+
+        if is_parquet:
+            table = pq.read_table(input)
+        else:
+            table = pa.ipc.open_file(input).read_all()
 
+        return self._table_to_dataframe(table)
+
+    def deserialize_bytes(self, data: memoryview) -> Any:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not _is_whole_buffer(data):
+            # A slice of a collection's buffer: columns Arrow keeps backed by
+            # it (e.g. strings) would otherwise pin all of it
+            data = memoryview(bytes(data))
+
+        # Wrap the buffer without copying it
+        buffer = pa.py_buffer(data)
+
+        # Entries written before the switch to Arrow IPC are Parquet files
+        if data[: len(_PARQUET_MAGIC)] == _PARQUET_MAGIC:
+            table = pq.read_table(pa.BufferReader(buffer))
+        else:
+            table = pa.ipc.open_file(buffer).read_all()
+
+        return self._table_to_dataframe(table)
+
+    def _table_to_dataframe(self, table) -> Any:
+        """Convert a table read back from disk into the original DataFrame."""
         # Read metadata to determine which columns to convert back
         metadata_bytes = (
             table.schema.metadata.get(b"serializer_metadata")
             if table.schema.metadata
             else None
         )
+        df = table.to_pandas(self_destruct=True)
+        del table
+
         if metadata_bytes:
             metadata = json.loads(metadata_bytes.decode())
             ndarray_columns = metadata.get("ndarray_columns", [])
@@ -120,76 +267,346 @@ class PandasSerializer(Serializer):
         return df
 
 
+class NumpySerializer(Serializer):
+    """
+    Serializer for numpy arrays using the `.npy` format.
+
+    A cached array read from its own file is returned as a view over the
+    buffer the file was read into, so a cache hit doesn't copy its data.
+    Arrays taken from a collection are copied out, so they don't keep the
+    rest of the file's contents alive. Arrays of Python objects are pickled
+    by numpy and loaded the regular way.
+    """
+
+    def serialize(self, value: Any, out: BinaryIO) -> None:
+        import numpy as np
+
+        if not isinstance(value, np.ndarray):
+            raise ValueError("NumpySerializer can only serialize ndarrays.")
+        np.save(out, value, allow_pickle=value.dtype.hasobject)
+
+    def deserialize(self, input: BinaryIO) -> Any:
+        return self.deserialize_bytes(memoryview(input.read()))
+
+    def deserialize_bytes(self, data: memoryview) -> Any:
+        import numpy as np
+        from numpy.lib import format as npy_format
+
+        reader = _BufferReader(data)
+        version = npy_format.read_magic(reader)
+        if version == (1, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_1_0(
+                reader
+            )
+        elif version == (2, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_2_0(
+                reader
+            )
+        else:
+            shape, fortran_order, dtype = (), False, None
+
+        if dtype is None or dtype.hasobject:
+            # Pickled object arrays and newer header versions
+            return np.load(BytesIO(data), allow_pickle=True)
+
+        arr = np.ndarray(
+            shape,
+            dtype=dtype,
+            buffer=data,
+            offset=reader.tell(),
+            order="F" if fortran_order else "C",
+        )
+        # Views are only kept over a whole, writable buffer (e.g. a file
+        # fetched from the cache). Slices of a larger buffer are copied so
+        # they don't pin all of it, and read-only buffers so the result
+        # behaves like np.load's.
+        if data.readonly or not _is_whole_buffer(data):
+            return arr.copy(order="K")
+        return arr
+
+
+def _is_whole_buffer(data: memoryview) -> bool:
+    """Check whether a view covers all of the object it was taken from."""
+    return data.nbytes == memoryview(data.obj).nbytes
+
+
+class _BufferReader:
+    """
+    Minimal binary reader over an in-memory buffer.
+
+    `read` returns bytes so the reader can be handed to pickle.load, while
+    `read_view` returns zero-copy slices of the underlying buffer.
+    """
+
+    def __init__(self, data: memoryview):
+        self._data = data
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        return bytes(self.read_view(size))
+
+    def readline(self) -> bytes:
+        # Search a chunk at a time rather than copying the rest of the buffer
+        start = end = self._position
+        while end < len(self._data):
+            chunk = bytes(self._data[end : end + _READLINE_CHUNK])
+            newline = chunk.find(b"\n")
+            if newline >= 0:
+                end += newline + 1
+                break
+            end += len(chunk)
+        self._position = end
+        return bytes(self._data[start:end])
+
+    def read_view(self, size: int = -1) -> memoryview:
+        start = self._position
+        if size < 0:
+            self._position = len(self._data)
+        else:
+            self._position = min(start + size, len(self._data))
+        return self._data[start : self._position]
+
+    def tell(self) -> int:
+        return self._position
+
+    def read_length(self) -> int:
+        """Read an 8-byte big-endian length prefix."""
+        return _unpack_length(self.read_view(_LENGTH.size))[0]
+
+
+def _has_custom_types(
+    values: Iterable, registry: dict[type, Serializer]
+) -> bool:
+    """
+    Check whether any of the values has a registered serializer.
+
+    The scan runs in C (map + any) and stops at the first hit. Nested
+    collections count as custom since their types are registered; their own
+    contents are checked again when they're written.
+    """
+    return any(map(registry.__contains__, map(type, values)))
+
+
+def _serializer_for(
+    value: Any, registry: dict[type, Serializer]
+) -> Serializer | None:
+    """Return the serializer to use for a value, or None to pickle it."""
+    serializer = registry.get(type(value))
+    if serializer is not None and serializer.accepts(value):
+        return serializer
+    return None
+
+
+def _plan_elements(
+    values: Iterable, registry: dict[type, Serializer]
+) -> tuple[list, list[tuple[Any, Serializer | None]]]:
+    """
+    Work out the manifest entry of each element and the frames to write.
+
+    An entry is the element's type when it has a custom serializer, None when
+    it's pickled, or the index of an earlier element when the same object
+    appears again. Repeated objects (e.g. one DataFrame referenced several
+    times) are only written once and come back as a single shared object,
+    as they would from pickle.
+    """
+    entries: list = []
+    frames: list[tuple[Any, Serializer | None]] = []
+    first_index: dict[int, int] = {}
+    for index, element in enumerate(values):
+        serializer = _serializer_for(element, registry)
+        if serializer is None:
+            entries.append(None)
+            frames.append((element, None))
+            continue
+        earlier = first_index.setdefault(id(element), index)
+        if earlier != index:
+            entries.append(earlier)
+            continue
+        entries.append(type(element))
+        frames.append((element, serializer))
+    return entries, frames
+
+
+def _write_element(
+    element: Any,
+    serializer: Serializer | None,
+    out: BinaryIO,
+    scratch: BytesIO | None = None,
+) -> None:
+    """
+    Write one length-prefixed element to the stream.
+
+    Elements with a custom serializer are streamed straight into `out` when
+    it is seekable: a placeholder length is written first and patched once
+    the element's size is known, so large values (e.g. DataFrames) are never
+    held in memory twice. Otherwise they're staged in `scratch`, a buffer
+    the caller reuses across elements. Everything else is pickled to bytes
+    first.
+    """
+    if serializer is not None and out.seekable():
+        # Reserve the length prefix, stream the element, then patch it
+        prefix_position = out.tell()
+        out.write(bytes(_LENGTH.size))
+        start = out.tell()
+        serializer.serialize(element, out)
+        end = out.tell()
+        out.seek(prefix_position)
+        out.write(_pack_length(end - start))
+        out.seek(end)
+        return
+
+    if serializer is not None:
+        # Stage the element in the reused buffer, then copy it out
+        if scratch is None:
+            scratch = BytesIO()
+        scratch.seek(0)
+        scratch.truncate()
+        serializer.serialize(element, scratch)
+        with scratch.getbuffer() as element_bytes:
+            out.write(_pack_length(len(element_bytes)))
+            out.write(element_bytes)
+        return
+
+    # Fall back to pickle. Large contiguous buffers (numpy arrays, pandas
+    # blocks) are collected out-of-band instead of being copied into the
+    # pickle stream, then written after it.
+    buffers: list[pickle.PickleBuffer] = []
+    element_bytes = pickle.dumps(
+        element, protocol=_PICKLE_PROTOCOL, buffer_callback=buffers.append
+    )
+    out.write(_pack_length(len(element_bytes)))
+    out.write(element_bytes)
+    out.write(_pack_length(len(buffers)))
+    for buffer in buffers:
+        raw = buffer.raw()
+        out.write(_pack_length(raw.nbytes))
+        out.write(raw)
+
+
+def _read_element(
+    element_type: type,
+    reader: _BufferReader,
+    registry: dict[type, Serializer],
+    version: int,
+) -> Any:
+    """Read one length-prefixed element written by `_write_element`."""
+    # Slice the element out of the buffer without copying it
+    element_bytes = reader.read_view(reader.read_length())
+
+    serializer = registry.get(element_type)
+    if isinstance(serializer, NumpySerializer) and version < 3:
+        # Older manifests list the type of pickled elements too, and arrays
+        # were always pickled before NumpySerializer existed
+        serializer = None
+    if serializer is not None:
+        # Use custom serializer
+        return serializer.deserialize_bytes(element_bytes)
+
+    if version < 2:
+        # Written before out-of-band buffers were supported
+        return pickle.loads(element_bytes)
+
+    # Out-of-band buffers are copied rather than used in place, so arrays
+    # rebuilt on top of them are writable and don't pin the whole file.
+    buffers = [
+        bytearray(reader.read_view(reader.read_length()))
+        for _ in range(reader.read_length())
+    ]
+    return pickle.loads(element_bytes, buffers=buffers)
+
+
+def _read_elements(
+    entries: list,
+    reader: _BufferReader,
+    registry: dict[type, Serializer],
+    version: int,
+) -> list:
+    """Read the elements described by a manifest written by `_plan_elements`."""
+    elements: list = []
+    for entry in entries:
+        if isinstance(entry, int):
+            # Same object as an earlier element; it has no frame of its own
+            elements.append(elements[entry])
+        else:
+            elements.append(_read_element(entry, reader, registry, version))
+    return elements
+
+
+def _write_manifest(manifest: list, out: BinaryIO) -> None:
+    """
+    Write a collection manifest tagged with the current format version.
+
+    When every entry is the same (e.g. a list of DataFrames), only that entry
+    and the number of elements are written.
+    """
+    if len(manifest) > 1 and manifest.count(manifest[0]) == len(manifest):
+        header = (_FORMAT_VERSION, manifest[0], len(manifest))
+    else:
+        header = (_FORMAT_VERSION, manifest)
+    pickle.dump(header, out, protocol=_PICKLE_PROTOCOL)
+
+
+def _read_manifest(reader: _BufferReader) -> tuple[int, list]:
+    """Read a collection manifest, returning its format version and types."""
+    manifest = pickle.load(reader)
+    if isinstance(manifest, list):
+        # Written before manifests carried a format version
+        return 1, manifest
+    if len(manifest) == 3:
+        # Homogeneous collection: one entry repeated for every element
+        version, entry, count = manifest
+        return version, [entry] * count
+    return manifest
+
+
 class ListSerializer(Serializer):
     """
     Serializer for lists supporting both homogeneous and heterogeneous types.
 
     Uses a self-contained format:
-    1. Pickled type manifest (list of types for each element)
-    2. Length-prefixed serialized elements
-
-    For elements with custom serializers, uses BytesIO buffers.
-    For elements without custom serializers, falls back to pickle.
+    1. Pickled manifest (format version and the serializer type of each
+       element, None for pickled elements, or the index of an earlier
+       element that is the same object)
+    2. Length-prefixed serialized elements, skipping repeated objects
+
+    For elements with custom serializers, streams them into the output.
+    For elements without custom serializers, falls back to pickle with
+    out-of-band buffers.
     """
 
-    def serialize(self, value: list, out: BinaryIO) -> None:
-        from io import BytesIO
+    def accepts(self, value: list) -> bool:
+        # Collections of plain values are much faster to pickle in one go
+        from kissml.settings import settings
+
+        return _has_custom_types(value, settings.serialize_by_type)
 
+    def serialize(self, value: list, out: BinaryIO) -> None:
         from kissml.settings import settings
 
-        # Write manifest: list of types for each element
-        manifest = [type(elem) for elem in value]
-        pickle.dump(manifest, out)
-
-        # Serialize each element
-        for element in value:
-            element_type = type(element)
-
-            if element_type in settings.serialize_by_type:
-                # Use custom serializer with BytesIO buffer
-                serializer = settings.serialize_by_type[element_type]
-                buffer = BytesIO()
-                serializer.serialize(element, buffer)
-                element_bytes = buffer.getvalue()
-            else:
-                # Fall back to pickle
-                element_bytes = pickle.dumps(element)
-
-            # Write length prefix and bytes
-            length = len(element_bytes)
-            out.write(length.to_bytes(8, byteorder="big"))
-            out.write(element_bytes)
+        # Write manifest: type of each custom-serialized element, None for
+        # pickled ones, or the index of an earlier copy of the same object
+        manifest, frames = _plan_elements(value, settings.serialize_by_type)
+        _write_manifest(manifest, out)
+
+        # Serialize each element, sharing one staging buffer between them
+        scratch = BytesIO()
+        for element, serializer in frames:
+            _write_element(element, serializer, out, scratch)
 
     def deserialize(self, input: BinaryIO) -> list:
-        from io import BytesIO
+        return self.deserialize_bytes(memoryview(input.read()))
 
+    def deserialize_bytes(self, data: memoryview) -> list:
         from kissml.settings import settings
 
         # Read manifest
-        manifest = pickle.load(input)
+        reader = _BufferReader(data)
+        version, manifest = _read_manifest(reader)
 
         # Deserialize each element
-        result = []
-        for element_type in manifest:
-            # Read length prefix
-            length_bytes = input.read(8)
-            length = int.from_bytes(length_bytes, byteorder="big")
-
-            # Read element bytes
-            element_bytes = input.read(length)
-
-            if element_type in settings.serialize_by_type:
-                # Use custom serializer
-                serializer = settings.serialize_by_type[element_type]
-                buffer = BytesIO(element_bytes)
-                element = serializer.deserialize(buffer)
-            else:
-                # Fall back to pickle
-                element = pickle.loads(element_bytes)
-
-            result.append(element)
-
-        return result
+        return _read_elements(
+            manifest, reader, settings.serialize_by_type, version
+        )
 
 
 class TupleSerializer(Serializer):
@@ -197,71 +614,51 @@ class TupleSerializer(Serializer):
     Serializer for tuples supporting both homogeneous and heterogeneous types.
 
     Uses a self-contained format:
-    1. Pickled type manifest (list of types for each element)
-    2. Length-prefixed serialized elements
-
-    For elements with custom serializers, uses BytesIO buffers.
-    For elements without custom serializers, falls back to pickle.
+    1. Pickled manifest (format version and the serializer type of each
+       element, None for pickled elements, or the index of an earlier
+       element that is the same object)
+    2. Length-prefixed serialized elements, skipping repeated objects
+
+    For elements with custom serializers, streams them into the output.
+    For elements without custom serializers, falls back to pickle with
+    out-of-band buffers.
     """
 
-    def serialize(self, value: tuple, out: BinaryIO) -> None:
-        from io import BytesIO
+    def accepts(self, value: tuple) -> bool:
+        # Collections of plain values are much faster to pickle in one go
+        from kissml.settings import settings
 
+        return _has_custom_types(value, settings.serialize_by_type)
+
+    def serialize(self, value: tuple, out: BinaryIO) -> None:
         from kissml.settings import settings
 
-        # Write manifest: list of types for each element
-        manifest = [type(elem) for elem in value]
-        pickle.dump(manifest, out)
-
-        # Serialize each element
-        for element in value:
-            element_type = type(element)
-
-            if element_type in settings.serialize_by_type:
-                # Use custom serializer with BytesIO buffer
-                serializer = settings.serialize_by_type[element_type]
-                buffer = BytesIO()
-                serializer.serialize(element, buffer)
-                element_bytes = buffer.getvalue()
-            else:
-                # Fall back to pickle
-                element_bytes = pickle.dumps(element)
-
-            # Write length prefix and bytes
-            length = len(element_bytes)
-            out.write(length.to_bytes(8, byteorder="big"))
-            out.write(element_bytes)
+        # Write manifest: type of each custom-serialized element, None for
+        # pickled ones, or the index of an earlier copy of the same object
+        manifest, frames = _plan_elements(value, settings.serialize_by_type)
+        _write_manifest(manifest, out)
+
+        # Serialize each element, sharing one staging buffer between them
+        scratch = BytesIO()
+        for element, serializer in frames:
+            _write_element(element, serializer, out, scratch)
 
     def deserialize(self, input: BinaryIO) -> tuple:
-        from io import BytesIO
+        return self.deserialize_bytes(memoryview(input.read()))
 
+    def deserialize_bytes(self, data: memoryview) -> tuple:
         from kissml.settings import settings
 
         # Read manifest
-        manifest = pickle.load(input)
+        reader = _BufferReader(data)
+        version, manifest = _read_manifest(reader)
 
         # Deserialize each element
-        result = []
-        for element_type in manifest:
-            # Read length prefix
-            length_bytes = input.read(8)
-            length = int.from_bytes(length_bytes, byteorder="big")
-
-            # Read element bytes
-            element_bytes = input.read(length)
-
-            if element_type in settings.serialize_by_type:
-                # Use custom serializer
-                serializer = settings.serialize_by_type[element_type]
-                buffer = BytesIO(element_bytes)
-                element = serializer.deserialize(buffer)
-            else:
-                # Fall back to pickle
-                element = pickle.loads(element_bytes)
-
-            result.append(element)
-
-        return tuple(result)
+        return tuple(
+            _read_elements(
+                manifest, reader, settings.serialize_by_type, version
+            )
+        )
 
 
 class DictSerializer(Serializer):
@@ -269,86 +666,61 @@ class DictSerializer(Serializer):
     Serializer for dicts supporting both homogeneous and heterogeneous types.
 
     Uses a self-contained format:
-    1. Pickled key-value type manifest (list of (key_type, value_type) tuples)
-    2. Length-prefixed serialized key-value pairs
-
-    For keys/values with custom serializers, uses BytesIO buffers.
-    For keys/values without custom serializers, falls back to pickle.
+    1. Pickled manifest (format version and (key_type, value_type) pairs,
+       None for pickled keys/values, or the flat index of an earlier key or
+       value that is the same object)
+    2. Length-prefixed serialized key-value pairs, skipping repeated objects
+
+    For keys/values with custom serializers, streams them into the output.
+    For keys/values without custom serializers, falls back to pickle with
+    out-of-band buffers.
     """
 
-    def serialize(self, value: dict, out: BinaryIO) -> None:
-        from io import BytesIO
+    def accepts(self, value: dict) -> bool:
+        # Dicts of plain keys and values are much faster to pickle in one go
+        from kissml.settings import settings
 
+        registry = settings.serialize_by_type
+        return _has_custom_types(
+            value.values(), registry
+        ) or _has_custom_types(value.keys(), registry)
+
+    def serialize(self, value: dict, out: BinaryIO) -> None:
         from kissml.settings import settings
 
-        # Write manifest: list of (key_type, value_type) for each pair
-        manifest = [(type(k), type(v)) for k, v in value.items()]
-        pickle.dump(manifest, out)
-
-        # Serialize each key-value pair
-        for key, val in value.items():
-            key_type = type(key)
-            val_type = type(val)
-
-            # Serialize key
-            if key_type in settings.serialize_by_type:
-                serializer = settings.serialize_by_type[key_type]
-                buffer = BytesIO()
-                serializer.serialize(key, buffer)
-                key_bytes = buffer.getvalue()
-            else:
-                key_bytes = pickle.dumps(key)
-
-            # Serialize value
-            if val_type in settings.serialize_by_type:
-                serializer = settings.serialize_by_type[val_type]
-                buffer = BytesIO()
-                serializer.serialize(val, buffer)
-                val_bytes = buffer.getvalue()
-            else:
-                val_bytes = pickle.dumps(val)
-
-            # Write length-prefixed key and value
-            key_length = len(key_bytes)
-            val_length = len(val_bytes)
-            out.write(key_length.to_bytes(8, byteorder="big"))
-            out.write(key_bytes)
-            out.write(val_length.to_bytes(8, byteorder="big"))
-            out.write(val_bytes)
+        # Plan keys and values as one flat sequence so repeated objects are
+        # found wherever they appear
+        entries, frames = _plan_elements(
+            (item for pair in value.items() for item in pair),
+            settings.serialize_by_type,
+        )
+
+        # Write manifest: (key_entry, value_entry) for each pair, where an
+        # entry is a type, None when pickled, or the flat index of an earlier
+        # copy of the same object
+        manifest = list(zip(entries[::2], entries[1::2]))
+        _write_manifest(manifest, out)
+
+        # Serialize each key and value, sharing one staging buffer
+        scratch = BytesIO()
+        for element, serializer in frames:
+            _write_element(element, serializer, out, scratch)
 
     def deserialize(self, input: BinaryIO) -> dict:
-        from io import BytesIO
+        return self.deserialize_bytes(memoryview(input.read()))
 
+    def deserialize_bytes(self, data: memoryview) -> dict:
         from kissml.settings import settings
 
         # Read manifest
-        manifest = pickle.load(input)
-
-        # Deserialize each key-value pair
-        result = {}
-        for key_type, val_type in manifest:
-            # Read key
-            key_length = int.from_bytes(input.read(8), byteorder="big")
-            key_bytes = input.read(key_length)
-
-            if key_type in settings.serialize_by_type:
-                serializer = settings.serialize_by_type[key_type]
-                buffer = BytesIO(key_bytes)
-                key = serializer.deserialize(buffer)
-            else:
-                key = pickle.loads(key_bytes)
-
-            # Read value
-            val_length = int.from_bytes(input.read(8), byteorder="big")
-            val_bytes = input.read(val_length)
-
-            if val_type in settings.serialize_by_type:
-                serializer = settings.serialize_by_type[val_type]
-                buffer = BytesIO(val_bytes)
-                val = serializer.deserialize(buffer)
-            else:
-                val = pickle.loads(val_bytes)
-
-            result[key] = val
-
-        return result
+        reader = _BufferReader(data)
+        version, manifest = _read_manifest(reader)
+
+        # Deserialize keys and values as one flat sequence
+        elements = _read_elements(
+            [entry for pair in manifest for entry in pair],
+            reader,
+            settings.serialize_by_type,
+            version,
+        )
+        return dict(zip(elements[::2], elements[1::2]))
@@ -1,3 +1,4 @@
+import pickle
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -8,6 +9,7 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from kissml.serializers import (
     DictSerializer,
     ListSerializer,
+    NumpySerializer,
     PandasSerializer,
     TupleSerializer,
 )
@@ -18,20 +20,76 @@ def _default_hash_by_type() -> dict[type, Callable[[Any], str]]:
     rv: dict[type, Callable[[Any], str]] = {}
     try:
         from hashlib import sha256
-        from io import BytesIO
 
-        import pandas as pd
+        import numpy as np
+
+        def _hash_ndarray(arr: np.ndarray) -> str:
+            """Hash an array's dtype, shape and raw data."""
+            h = sha256(f"{arr.dtype.str}:{arr.shape}".encode())
+            if arr.dtype.hasobject:
+                # Python objects have no raw bytes; hash their pickles, as
+                # str() truncates nested arrays
+                h.update(pickle.dumps(arr, protocol=5))
+            else:
+                # Hash the buffer in place, in C order whatever the layout.
+                # Viewed as bytes, since some dtypes (e.g. datetime64) can't
+                # be exported as buffers.
+                h.update(np.ascontiguousarray(arr).view(np.uint8).data)
+            return h.hexdigest()
+
+        rv[np.ndarray] = _hash_ndarray
+    except ImportError:
+        pass
+    try:
+        from hashlib import sha256
 
-        def _hash_dataframe_via_serialization(df: pd.DataFrame) -> str:
-            """Hash a DataFrame by serializing it to Parquet and hashing the bytes."""
-            serializer = PandasSerializer()
-            buffer = BytesIO()
-            serializer.serialize(df, buffer)
-            return sha256(buffer.getvalue()).hexdigest()
+        import pandas as pd
 
-        rv[pd.DataFrame] = _hash_dataframe_via_serialization
-        rv[pd.Series] = lambda s: str(pd.util.hash_pandas_object(s))
-        rv[pd.Index] = lambda i: str(pd.util.hash_pandas_object(i))
+        packer = PandasSerializer()
+
+        def _hash_values(obj: pd.Series | pd.Index, index: bool) -> pd.Series:
+            """Hash each value (and optionally index entry) of a Series or Index."""
+            try:
+                return pd.util.hash_pandas_object(obj, index=index)
+            except (TypeError, ValueError):
+                # Cells pandas can't hash (e.g. dicts or lists) are hashed by
+                # their pickled bytes instead
+                return pd.util.hash_pandas_object(
+                    obj.map(lambda cell: pickle.dumps(cell, protocol=5)),
+                    index=index,
+                )
+
+        def _hash_dataframe(df: pd.DataFrame) -> str:
+            """Hash a DataFrame column by column with pandas' vectorized hashing."""
+            # Axis names aren't part of the values pandas hashes
+            h = sha256(f"{df.index.names!r}:{df.columns.names!r}".encode())
+            h.update(_hash_values(df.index, index=False).to_numpy().tobytes())
+            ndarray_columns = set(packer.ndarray_columns(df))
+            for col, series in df.items():
+                h.update(f"{col!r}:{series.dtype}".encode())
+                if col in ndarray_columns:
+                    # Hash the array bytes; their str() form is truncated
+                    series = series.map(packer._ndarray_to_bytes)
+                hashed = _hash_values(series, index=False)
+                h.update(hashed.to_numpy().tobytes())
+            return h.hexdigest()
+
+        def _hash_pandas_object(obj: pd.Series | pd.Index) -> str:
+            """Hash a Series (with its index) or an Index by its values."""
+            # Names aren't part of the values pandas hashes
+            names = (
+                (obj.name, obj.index.names)
+                if isinstance(obj, pd.Series)
+                else obj.names
+            )
+            h = sha256(f"{obj.dtype}:{names!r}".encode())
+            hashed = _hash_values(obj, index=True)
+            h.update(hashed.to_numpy().tobytes())
+            return h.hexdigest()
+
+        rv[pd.DataFrame] = _hash_dataframe
+        rv[pd.Series] = _hash_pandas_object
+        rv[pd.Index] = _hash_pandas_object
     except ImportError:
         pass
     return rv
@@ -43,6 +101,12 @@ def _default_serializer_by_type() -> dict[type, Serializer]:
         tuple: TupleSerializer(),
         dict: DictSerializer(),
     }
+    try:
+        import numpy as np
+
+        rv[np.ndarray] = NumpySerializer()
+    except ImportError:
+        pass
     try:
         import pandas as pd
 
@@ -1,26 +1,256 @@
 import inspect
 import logging
 import time
-from collections.abc import Callable
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from functools import wraps
 from types import FunctionType
-from typing import ParamSpec, TypeVar, cast, get_type_hints
+from typing import Any, ParamSpec, TypeVar, cast, get_type_hints
+from weakref import WeakKeyDictionary, finalize
 
-from .core import create_cache_key, get_cache
+from diskcache import ENOVAL, Cache
+
+from . import core
+from .core import create_cache_digest, get_cache
 from .settings import settings
 from .types import AfterEffect, CacheConfig
 
+_LOGGER = logging.getLogger(__name__)
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
-# Sentinel value to distinguish "not in cache" from "cached None"
-_CACHE_MISS = object()
+# Number of recent argument sets remembered per step with identity_memo
+_IDENTITY_MEMO_SIZE = 1024
+
+# Immutable argument types identity_memo keys by value rather than by id.
+# Floats and complex numbers are keyed by repr.
+_IDENTITY_MEMO_SCALARS = frozenset({type(None), bool, int, str, bytes})
+
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_VARIADIC_KINDS = (
+    inspect.Parameter.VAR_POSITIONAL,
+    inspect.Parameter.VAR_KEYWORD,
+)
+
+
+# Signatures of decorated callables, shared when one is decorated repeatedly
+_SIGNATURES: WeakKeyDictionary[Callable[..., Any], inspect.Signature] = (
+    WeakKeyDictionary()
+)
+
+
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Get a callable's signature, reusing one computed earlier if possible."""
+    try:
+        sig = _SIGNATURES.get(func)
+    except TypeError:
+        # Not weak-referenceable (e.g. some builtins)
+        return inspect.signature(func)
+    if sig is None:
+        sig = inspect.signature(func)
+        _SIGNATURES[func] = sig
+    return sig
+
+
+def _simple_parameters(
+    func: Callable[..., Any],
+) -> tuple[tuple[str, ...], dict[str, Any]] | None:
+    """
+    Read parameter names and defaults straight from a function's code object.
+
+    Only plain functions whose parameters can all be passed positionally or
+    by keyword are handled; anything else (e.g. *args, keyword-only
+    parameters, a `__wrapped__` function whose signature inspect would
+    report instead, or a bound method, whose `__code__` still lists `self`)
+    returns None.
+    """
+    if type(func) is not FunctionType:
+        return None
+    code = func.__code__
+    if (
+        hasattr(func, "__wrapped__")
+        or hasattr(func, "__signature__")
+        or code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        or code.co_posonlyargcount
+        or code.co_kwonlyargcount
+    ):
+        return None
+    names = code.co_varnames[: code.co_argcount]
+    values = getattr(func, "__defaults__", None) or ()
+    return names, dict(zip(names[len(names) - len(values) :], values))
+
+
+def _make_binder(func: Callable[..., Any]) -> Callable[..., dict[str, Any]]:
+    """
+    Build a function mapping call arguments to a dict of every parameter.
+
+    The result matches `sig.bind(...)` followed by `apply_defaults()`. Binding
+    is slow, so once a call shape (number of positional arguments and the
+    keyword names) has bound successfully, later calls with that shape are
+    mapped directly. The shape also fixes which defaults are needed, so only
+    those are filled in. Signatures with *args or **kwargs always use
+    `sig.bind`.
+
+    For simple functions the parameters are read from the code object, and
+    the signature is only built the first time a call shape needs binding.
+    """
+    sig: inspect.Signature | None = None
+    simple = _simple_parameters(func)
+    if simple is not None:
+        positional_names, defaults = simple
+        variadic = False
+    else:
+        sig = _signature(func)
+        parameters = sig.parameters.values()
+        variadic = any(p.kind in _VARIADIC_KINDS for p in parameters)
+        positional_names = tuple(
+            p.name for p in parameters if p.kind in _POSITIONAL_KINDS
+        )
+        defaults = {
+            p.name: p.default
+            for p in parameters
+            if p.default is not inspect.Parameter.empty
+        }
+
+    # Defaults to fill in for each call shape that has bound successfully
+    missing_by_shape: dict[tuple[int, frozenset[str]], dict[str, Any]] = {}
+
+    def bind(args: tuple, kwargs: dict[str, Any]) -> dict[str, Any]:
+        nonlocal sig
+        shape = (len(args), frozenset(kwargs))
+        missing = missing_by_shape.get(shape)
+        if missing is not None:
+            arguments = dict(zip(positional_names, args), **kwargs)
+            if missing:
+                arguments.update(missing)
+            return arguments
+
+        # Validate the call and normalize it the slow way
+        if sig is None:
+            sig = _signature(func)
+        bound = sig.bind(*args, **kwargs)
+        if not variadic:
+            missing_by_shape[shape] = {
+                name: value
+                for name, value in defaults.items()
+                if name not in bound.arguments
+            }
+        bound.apply_defaults()
+        return bound.arguments
+
+    return bind
+
+
+def _make_identity_memo(
+    version: int, maxsize: int = _IDENTITY_MEMO_SIZE
+) -> Callable[[dict[str, Any]], bytes]:
+    """
+    Build an LRU of cache keys for argument sets, matched by object identity.
+
+    Entries are keyed on each argument's name and id, and only hold weak
+    references to the arguments: when one is garbage collected its entries
+    are dropped, so an id can't match a new object that reuses it. Immutable
+    scalars are keyed by value instead. Argument sets with anything else
+    (e.g. lists, which can't be weakly referenced) are hashed every call.
+    """
+    memo: OrderedDict[frozenset, tuple[list[finalize], bytes]] = OrderedDict()
+
+    def forget(identity: frozenset) -> None:
+        entry = memo.pop(identity, None)
+        if entry is not None:
+            for finalizer in entry[0]:
+                finalizer.detach()
+
+    def cache_key_for(arguments: dict[str, Any]) -> bytes:
+        parts = []
+        referents = []
+        for name, value in arguments.items():
+            if type(value) in (float, complex):
+                # By repr, so e.g. 0.0 and -0.0 stay apart
+                parts.append((name, type(value), repr(value)))
+            elif type(value) in _IDENTITY_MEMO_SCALARS:
+                parts.append((name, type(value), value))
+            else:
+                parts.append((name, id(value)))
+                referents.append(value)
+        identity = frozenset(parts)
+
+        entry = memo.get(identity)
+        if entry is not None:
+            memo.move_to_end(identity)
+            return entry[1]
+
+        cache_key = create_cache_digest(version, **arguments)
+        finalizers = []
+        try:
+            for value in referents:
+                finalizers.append(finalize(value, forget, identity))
+        except TypeError:
+            # Not weakly referenceable, so its id could be reused unseen
+            for finalizer in finalizers:
+                finalizer.detach()
+            return cache_key
+        memo[identity] = (finalizers, cache_key)
+        if len(memo) > maxsize:
+            forget(next(iter(memo)))
+        return cache_key
+
+    return cache_key_for
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Compile a function with numba's nopython mode, if numba is installed.
+
+    Compilation happens on the first call for each argument type signature
+    and is cached on disk. Functions numba can't compile fall back to plain
+    Python for good.
+    """
+    try:
+        import numba
+        from numba.core.errors import NumbaError
+    except ImportError:
+        _LOGGER.warning(
+            "numba is not installed; %s will run without jit",
+            getattr(func, "__name__", func),
+        )
+        return func
+
+    try:
+        compiled = numba.njit(cache=True)(func)
+    except RuntimeError:
+        # No file to cache next to (e.g. defined interactively)
+        compiled = numba.njit(func)
+    use_compiled = True
+
+    @wraps(func)
+    def call(*args: Any, **kwargs: Any) -> Any:
+        nonlocal use_compiled
+        if use_compiled:
+            try:
+                return compiled(*args, **kwargs)
+            except NumbaError as e:
+                # Raised while compiling, before any of the body has run
+                _LOGGER.debug(
+                    "Falling back to Python for %s: %s",
+                    getattr(func, "__name__", func),
+                    e,
+                )
+                use_compiled = False
+        return func(*args, **kwargs)
+
+    return call
 
 
 def step(
     log_level: int | None = None,
     cache: CacheConfig | None = None,
     error_on_effect_failure: bool = False,
+    jit: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     Decorator for machine learning pipeline steps.
@@ -43,6 +273,9 @@ def step(
             Different eviction policies can be configured per function.
         error_on_effect_failure: If True, AfterEffect failures raise exceptions.
             If False (default), AfterEffect errors are logged but don't stop execution.
+        jit: If True, compile the function with numba's nopython mode (numba
+            must be installed). Meant for numeric functions with plain Python
+            loops; functions numba can't compile run as regular Python.
 
     Returns:
         Decorated function that logs execution time and caches results.
@@ -54,6 +287,11 @@ def step(
           f(1, 2) and f(a=1, b=2) produce identical cache keys
         - Cache is isolated per function name and eviction policy
         - Bumping the version number invalidates old cached results
+        - The decorated function has a `batch(calls)` method taking an iterable
+          of positional argument tuples; cache lookups and stores for the
+          whole batch each happen in a single transaction
+        - With jit=True, the first call for each argument type signature
+          includes numba's compile time unless it's already cached on disk
 
     Examples:
         Basic timing without caching:
@@ -109,67 +347,34 @@ def step(
         # Cast to FunctionType to help type checker understand func has __name__
         func_typed = cast(FunctionType, func)
 
-        # Get function signature once at decoration time
-        sig = inspect.signature(func_typed)
-
-        # Cache type hints in closure to avoid repeated get_type_hints() calls
-        type_hints_cache: dict | None = None
-
-        @wraps(func_typed)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            start_time = time.time()
-            was_cached = False
+        # The callable that does the work, compiled if requested
+        run: Callable[..., R] = _jit(func) if jit else func
 
-            # Handle caching if enabled
-            if cache is not None:
-                # Get the cache for this function
-                cache_instance = get_cache(
-                    func_typed.__name__, cache.eviction_policy, cache.namespace
-                )
+        # Normalizes call arguments for cache keys
+        bind_arguments = _make_binder(func_typed)
+        identity_memo = (
+            _make_identity_memo(cache.version)
+            if cache is not None and cache.identity_memo
+            else None
+        )
 
-                # Bind arguments to normalize positional and keyword args
-                bound = sig.bind(*args, **kwargs)
-                bound.apply_defaults()
+        # Log message templates, built once per function
+        completed_message = f"{func_typed.__name__} completed in %.4f seconds"
+        cached_message = f"{completed_message} (cached)"
 
-                # Create cache key from version + normalized arguments
-                arg_hash = create_cache_key(**bound.arguments)
-                cache_key = (cache.version, arg_hash)
+        # Cache type hints in closure to avoid repeated get_type_hints() calls
+        type_hints_cache: dict | None = None
 
-                # Check if result is cached
-                # Use sentinel to distinguish "not in cache" from "cached None"
-                cached_result = cache_instance.get(
-                    cache_key, default=_CACHE_MISS
+        def finish(result: R, was_cached: bool, elapsed_ns: int) -> R:
+            """Log the call and run its AfterEffects."""
+            execution_time = elapsed_ns / 1e9
+            if log_level is not None and _LOGGER.isEnabledFor(log_level):
+                # Formatting is left to the logging module
+                _LOGGER.log(
+                    log_level,
+                    cached_message if was_cached else completed_message,
+                    execution_time,
                 )
-                if cached_result is not _CACHE_MISS:
-                    result = cached_result
-                    was_cached = True
-                    execution_time = time.time() - start_time
-                    if log_level is not None:
-                        logging.log(
-                            log_level,
-                            f"{func_typed.__name__} completed in {execution_time:.4f} seconds (cached)",
-                        )
-                else:
-                    # Execute function if not cached
-                    result = func_typed(*args, **kwargs)
-                    execution_time = time.time() - start_time
-                    cache_instance.set(cache_key, result)
-                    if log_level is not None:
-                        logging.log(
-                            log_level,
-                            f"{func_typed.__name__} completed in {execution_time:.4f} seconds",
-                        )
-            else:
-                # Execute function without caching
-                result = func_typed(*args, **kwargs)
-                execution_time = time.time() - start_time
-
-                # Log execution time if logging is enabled
-                if log_level is not None:
-                    logging.log(
-                        log_level,
-                        f"{func_typed.__name__} completed in {execution_time:.4f} seconds",
-                    )
 
             def _run_effect(effect: AfterEffect) -> None:
                 if error_on_effect_failure:
@@ -188,8 +393,11 @@ def step(
                             execution_time,
                         )
                     except Exception as e:
-                        logging.error(
-                            f"AfterEffect {effect.__class__.__name__} failed for {func_typed.__name__}: {e}"
+                        _LOGGER.error(
+                            "AfterEffect %s failed for %s: %s",
+                            effect.__class__.__name__,
+                            func_typed.__name__,
+                            e,
                         )
 
             # Execute AfterEffects from type annotations
@@ -211,6 +419,124 @@ def step(
 
             return result
 
-        return wrapper
+        # Pick the wrapper once, so calls don't re-check the configuration
+        if cache is None:
+
+            @wraps(func_typed)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                start_ns = time.perf_counter_ns()
+                result = run(*args, **kwargs)
+                return finish(result, False, time.perf_counter_ns() - start_ns)
+
+            def batch(calls: Iterable[tuple]) -> list[R]:
+                """Call the step once per tuple of positional arguments."""
+                return [wrapper(*args) for args in calls]
+
+            wrapper.batch = batch  # ty:ignore[unresolved-attribute]
+            return wrapper
+
+        version = cache.version
+        eviction_policy = cache.eviction_policy
+        namespace = cache.namespace
+        if cache.warmup:
+            core.warm_cache(func_typed.__name__, eviction_policy, namespace)
+
+        # The Cache is looked up on first use and kept until caches are
+        # closed, keyed by the generation it was looked up in
+        resolved_caches: dict[int, Cache] = {}
+
+        def current_cache() -> Cache:
+            """Get the cache for this function."""
+            cache_instance = resolved_caches.get(core._generation)
+            if cache_instance is None:
+                resolved_caches.clear()
+                cache_instance = get_cache(
+                    func_typed.__name__, eviction_policy, namespace
+                )
+                resolved_caches[core._generation] = cache_instance
+            return cache_instance
+
+        def cache_key_for(args: tuple, kwargs: dict[str, Any]) -> bytes:
+            """Create the cache key from version + normalized arguments."""
+            # Bind arguments to normalize positional and keyword args
+            arguments = bind_arguments(args, kwargs)
+            if identity_memo is not None:
+                return identity_memo(arguments)
+            return create_cache_digest(version, **arguments)
+
+        @wraps(func_typed)
+        def cached_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start_ns = time.perf_counter_ns()
+            cache_instance = current_cache()
+            cache_key = cache_key_for(args, kwargs)
+
+            # Check if result is cached
+            # DiskCache's ENOVAL marks a miss, so a cached None is still a hit
+            # Retry rather than fail when another process holds the lock
+            cached_result = cache_instance.get(
+                cache_key, default=ENOVAL, retry=True
+            )
+            if cached_result is not ENOVAL:
+                return finish(
+                    cached_result, True, time.perf_counter_ns() - start_ns
+                )
+
+            # Execute function if not cached
+            result = run(*args, **kwargs)
+            elapsed_ns = time.perf_counter_ns() - start_ns
+            cache_instance.set(cache_key, result, retry=True)
+            return finish(result, False, elapsed_ns)
+
+        def cached_batch(calls: Iterable[tuple]) -> list[R]:
+            """
+            Call the step once per tuple of positional arguments.
+
+            Lookups are plain reads, which take no lock under the default
+            eviction policy, while new results are stored together in a
+            single cache transaction instead of one per call. Repeated
+            argument tuples are only computed once.
+            """
+            start_ns = time.perf_counter_ns()
+            cache_instance = current_cache()
+            calls = [tuple(args) for args in calls]
+            keys = [cache_key_for(args, {}) for args in calls]
+
+            found = [
+                cache_instance.get(key, default=ENOVAL, retry=True)
+                for key in keys
+            ]
+
+            # Hits share the time spent on the lookups
+            lookup_ns = (time.perf_counter_ns() - start_ns) // max(
+                len(calls), 1
+            )
+            computed: dict[bytes, tuple[R, int]] = {}
+            try:
+                for args, key, value in zip(calls, keys, found):
+                    if value is ENOVAL and key not in computed:
+                        call_start_ns = time.perf_counter_ns()
+                        result = run(*args)
+                        computed[key] = (
+                            result,
+                            time.perf_counter_ns() - call_start_ns,
+                        )
+            finally:
+                # Keep whatever was computed, even if a later call failed
+                if computed:
+                    with cache_instance.transact(retry=True):
+                        for key, (result, _) in computed.items():
+                            cache_instance.set(key, result)
+
+            results = []
+            for key, value in zip(keys, found):
+                if value is ENOVAL:
+                    result, elapsed_ns = computed[key]
+                    results.append(finish(result, False, elapsed_ns))
+                else:
+                    results.append(finish(value, True, lookup_ns))
+            return results
+
+        cached_wrapper.batch = cached_batch  # ty:ignore[unresolved-attribute]
+        return cached_wrapper
 
     return decorator
@@ -1,14 +1,17 @@
 from abc import ABC, abstractmethod
-from enum import Enum
+from dataclasses import dataclass
+from enum import StrEnum
+from io import BytesIO
 from typing import Any, BinaryIO
 
-from pydantic import BaseModel, Field
 
-
-class EvictionPolicy(Enum):
+class EvictionPolicy(StrEnum):
     """
     Cache eviction policies for DiskCache.
 
+    Members are strings equal to DiskCache's policy names, so they can be
+    passed to DiskCache as they are.
+
     Attributes:
         LEAST_RECENTLY_STORED: Default policy. Evicts oldest stored keys first.
             No update required on access. Best for large caches.
@@ -26,19 +29,49 @@ class EvictionPolicy(Enum):
     NONE = "none"
 
 
-class CacheConfig(BaseModel):
-    eviction_policy: EvictionPolicy = Field(
-        default=EvictionPolicy.NONE,
-        description="The eviction policy for the cache. Defaults to None (keeps forever). See https://grantjenks.com/docs/diskcache/api.html#diskcache.diskcache.EVICTION_POLICY",
-    )
-    version: int = Field(
-        default=0,
-        description="The cache version. Change this to invalidate all entries on a re-run.",
-    )
-    namespace: str | None = Field(
-        default=None,
-        description="Optional namespace for the cache. Useful for isolating caches between different parts of an application.",
-    )
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CacheConfig:
+    """
+    Caching options for a step.
+
+    Attributes:
+        eviction_policy: The eviction policy for the cache. Defaults to NONE
+            (keeps forever). See
+            https://grantjenks.com/docs/diskcache/api.html#diskcache.diskcache.EVICTION_POLICY
+        version: The cache version. Change this to invalidate all entries on
+            a re-run.
+        namespace: Optional namespace for the cache. Useful for isolating
+            caches between different parts of an application.
+        identity_memo: Reuse the cache key of recent calls whose arguments
+            are the very same objects, skipping argument hashing. Objects
+            mutated in place between calls keep their old key, so only enable
+            this for arguments that aren't modified. Arguments are only
+            weakly referenced, so the memo doesn't keep them alive; calls
+            with arguments that can't be weakly referenced (e.g. lists) are
+            always hashed.
+        warmup: Open the cache on a background thread when the step is
+            decorated, so its first call doesn't pay for creating the cache
+            directory and database. Off by default, since steps are often
+            decorated before settings.cache_directory is configured.
+    """
+
+    eviction_policy: EvictionPolicy = EvictionPolicy.NONE
+    version: int = 0
+    namespace: str | None = None
+    identity_memo: bool = False
+    warmup: bool = False
+
+    def __post_init__(self):
+        # The version is hashed into every key, so "2" and 2 would silently
+        # address different entries
+        if not isinstance(self.version, int) or isinstance(self.version, bool):
+            raise TypeError(
+                f"CacheConfig.version must be an int, got {self.version!r}"
+            )
+        # Accept DiskCache's policy names as well as EvictionPolicy members
+        object.__setattr__(
+            self, "eviction_policy", EvictionPolicy(self.eviction_policy)
+        )
 
 
 class Serializer(ABC):
@@ -49,10 +82,26 @@ class Serializer(ABC):
     Each serializer handles one type.
     """
 
+    def accepts(self, value: Any) -> bool:
+        """
+        Whether to use this serializer for a value of its registered type.
+
+        Returning False falls back to pickle, e.g. for collections that hold
+        nothing needing a custom serializer. Defaults to True.
+
+        Args:
+            value: The object about to be serialized
+        """
+        return True
+
     @abstractmethod
     def serialize(self, value: Any, out: BinaryIO) -> None:
         """
-        Write value to output stream at the given position.
+        Write value to the output stream, starting at its current position.
+
+        Values are streamed straight into the cache file, so implementations
+        should write incrementally rather than build the whole payload in
+        memory first.
 
         Args:
             value: The object to serialize
@@ -63,7 +112,7 @@ class Serializer(ABC):
     @abstractmethod
     def deserialize(self, input: BinaryIO) -> Any:
         """
-        Read value from the bytestream at the given path.
+        Read value from the byte stream, starting at its current position.
 
         Args:
             input: The file or byte stream to read from
@@ -73,6 +122,21 @@ class Serializer(ABC):
         """
         pass
 
+    def deserialize_bytes(self, data: memoryview) -> Any:
+        """
+        Read value from an in-memory buffer, such as a whole cache file.
+
+        The default implementation wraps the buffer in a BytesIO and calls
+        `deserialize`. Override it to read straight from the buffer.
+
+        Args:
+            data: The buffer holding exactly one serialized value
+
+        Returns:
+            The deserialized object
+        """
+        return self.deserialize(BytesIO(data))
+
 
 class AfterEffect(ABC):
     """
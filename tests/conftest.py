@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture
+def lower_open_file_limit():
+    """Lower the soft limit on open file descriptors for one test."""
+    resource = pytest.importorskip("resource")
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+
+    def lower(limit: int) -> None:
+        if soft < limit:
+            pytest.skip("open file limit is already below the test's limit")
+        resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
+
+    yield lower
+
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
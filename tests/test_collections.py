@@ -0,0 +1,262 @@
+import pickle
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kissml.core import close_all_caches
+from kissml.serializers import ListSerializer, PandasSerializer
+from kissml.settings import settings
+from kissml.step import step
+from kissml.types import CacheConfig
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Clean up cache before and after each test."""
+    # Setup: use temporary directory for tests
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original_cache_dir = settings.cache_directory
+        settings.cache_directory = Path(tmpdir)
+
+        yield
+
+        # Teardown: close all caches and restore original directory
+        close_all_caches()
+        settings.cache_directory = original_cache_dir
+
+
+def test_list_serializer_without_seekable_output():
+    """Test that collections serialize into streams that can't seek."""
+
+    class UnseekableBuffer(BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    df = pd.DataFrame({"a": range(3)})
+    value = [df, [df, 1], "metadata"]
+
+    serializer = ListSerializer()
+    out = UnseekableBuffer()
+    serializer.serialize(value, out)
+    result = serializer.deserialize(BytesIO(out.getvalue()))
+
+    pd.testing.assert_frame_equal(result[0], df)
+    pd.testing.assert_frame_equal(result[1][0], df)
+    assert result[1][1] == 1
+    assert result[2] == "metadata"
+
+
+def test_collections_without_custom_types_are_pickled_whole():
+    """Test that only collections holding custom types are framed."""
+    from kissml.serializers import DictSerializer
+
+    df = pd.DataFrame({"a": range(3)})
+
+    assert not ListSerializer().accepts([1, "two", 3.0])
+    assert ListSerializer().accepts([1, df])
+    assert not DictSerializer().accepts({"a": 1, "b": "two"})
+    assert DictSerializer().accepts({"a": 1, "b": df})
+
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def return_nested(rows: int) -> dict:
+        nonlocal call_count
+        call_count += 1
+        return {
+            "frame": pd.DataFrame({"a": range(rows)}),
+            "metrics": [0.5, 0.25],
+            "nested": [{"name": "x"}, (1, 2)],
+        }
+
+    result1 = return_nested(3)
+    result2 = return_nested(3)
+    assert call_count == 1  # Cache hit
+
+    pd.testing.assert_frame_equal(result1["frame"], result2["frame"])
+    assert result2["metrics"] == [0.5, 0.25]
+    assert result2["nested"] == [{"name": "x"}, (1, 2)]
+
+
+def test_repeated_objects_are_written_once():
+    """Test that an object repeated in a collection is stored only once."""
+    from kissml.serializers import DictSerializer
+
+    df = pd.DataFrame({"a": range(1000)})
+
+    single, repeated = BytesIO(), BytesIO()
+    ListSerializer().serialize([df, "metadata"], single)
+    ListSerializer().serialize([df, df, df, "metadata"], repeated)
+    assert len(repeated.getvalue()) < 2 * len(single.getvalue())
+
+    result = ListSerializer().deserialize_bytes(
+        memoryview(repeated.getvalue())
+    )
+    pd.testing.assert_frame_equal(result[0], df)
+    assert result[1] is result[0]
+    assert result[2] is result[0]
+    assert result[3] == "metadata"
+
+    # Keys and values share one sequence of elements
+    buffer = BytesIO()
+    DictSerializer().serialize({"train": df, "test": df, "n": 3}, buffer)
+    result = DictSerializer().deserialize_bytes(memoryview(buffer.getvalue()))
+    pd.testing.assert_frame_equal(result["train"], df)
+    assert result["test"] is result["train"]
+    assert result["n"] == 3
+
+
+def test_cached_collections_do_not_hold_file_descriptors(
+    lower_open_file_limit,
+):
+    """Test that framed and pickled elements don't keep cache files open."""
+
+    @step(cache=CacheConfig(version=0))
+    def make_values(n: int) -> list:
+        # The Series is pickled with out-of-band buffers
+        return [pd.DataFrame({"a": range(n)}), np.arange(n), pd.Series([n])]
+
+    count = 384
+    for n in range(count):
+        make_values(n)
+
+    lower_open_file_limit(256)
+    held = [make_values(n) for n in range(count)]  # All cache hits
+
+    assert [len(df) for df, _, _ in held] == list(range(count))
+    assert [int(series[0]) for _, _, series in held] == list(range(count))
+
+
+def test_list_serializer_reads_unversioned_manifest():
+    """Test that lists cached before manifests were versioned still load."""
+    buffer = BytesIO()
+    pickle.dump([int, str], buffer)
+    for element in (3, "metadata"):
+        element_bytes = pickle.dumps(element)
+        buffer.write(len(element_bytes).to_bytes(8, byteorder="big"))
+        buffer.write(element_bytes)
+    buffer.seek(0)
+
+    assert ListSerializer().deserialize(buffer) == [3, "metadata"]
+
+
+def _frame(data: bytes) -> bytes:
+    """Prefix an element's bytes with their 8-byte big-endian length."""
+    return len(data).to_bytes(8, byteorder="big") + data
+
+
+def _pickled_frame(value) -> bytes:
+    """Frame a pickled element followed by its out-of-band buffers."""
+    buffers = []
+    data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    return (
+        _frame(data)
+        + len(buffers).to_bytes(8, byteorder="big")
+        + b"".join(_frame(bytes(buffer.raw())) for buffer in buffers)
+    )
+
+
+def _dataframe_frame(df: pd.DataFrame) -> bytes:
+    """Frame a DataFrame written by its custom serializer."""
+    buffer = BytesIO()
+    PandasSerializer().serialize(df, buffer)
+    return _frame(buffer.getvalue())
+
+
+def test_list_serializer_reads_v2_manifest():
+    """Test that lists with a version 2 manifest of element types still load."""
+    df = pd.DataFrame({"a": range(3)})
+    series = pd.Series([1.0, 2.0])
+
+    # Every element's type is listed, pickled ones included
+    data = (
+        pickle.dumps((2, [pd.DataFrame, str, pd.Series]))
+        + _dataframe_frame(df)
+        + _pickled_frame("metadata")
+        + _pickled_frame(series)
+    )
+
+    result = ListSerializer().deserialize(BytesIO(data))
+    pd.testing.assert_frame_equal(result[0], df)
+    assert result[1] == "metadata"
+    pd.testing.assert_series_equal(result[2], series)
+
+
+def test_list_serializer_reads_v3_manifest():
+    """Test that lists with a version 3 manifest still load."""
+    df = pd.DataFrame({"a": range(3)})
+
+    # Pickled elements are listed as None
+    data = (
+        pickle.dumps((3, [pd.DataFrame, None]))
+        + _dataframe_frame(df)
+        + _pickled_frame("metadata")
+    )
+    result = ListSerializer().deserialize(BytesIO(data))
+    pd.testing.assert_frame_equal(result[0], df)
+    assert result[1] == "metadata"
+
+    # Homogeneous lists list their one type and the element count
+    data = (
+        pickle.dumps((3, pd.DataFrame, 2))
+        + _dataframe_frame(df)
+        + _dataframe_frame(df.tail(1))
+    )
+    result = ListSerializer().deserialize(BytesIO(data))
+    pd.testing.assert_frame_equal(result[0], df)
+    pd.testing.assert_frame_equal(result[1], df.tail(1))
+
+
+def test_list_serializer_reads_v4_manifest():
+    """Test the current format, where repeated objects refer back by index."""
+    df = pd.DataFrame({"a": range(3)})
+
+    data = (
+        pickle.dumps((4, [pd.DataFrame, 0, None]), protocol=5)
+        + _dataframe_frame(df)
+        + _pickled_frame("metadata")
+    )
+    result = ListSerializer().deserialize(BytesIO(data))
+    pd.testing.assert_frame_equal(result[0], df)
+    assert result[1] is result[0]
+    assert result[2] == "metadata"
+
+    # The writer still produces exactly this layout
+    out = BytesIO()
+    ListSerializer().serialize([df, df, "metadata"], out)
+    assert out.getvalue() == data
+
+
+def test_dataframes_in_collections_are_copied_out():
+    """Test that a DataFrame taken from a list doesn't share its buffer."""
+    df = pd.DataFrame({"name": ["x", "y"], "value": [1, 2]})
+
+    out = BytesIO()
+    ListSerializer().serialize([df, np.zeros(1000)], out)
+    data = bytearray(out.getvalue())
+    result = ListSerializer().deserialize_bytes(memoryview(data))
+
+    # Clobbering the collection's buffer leaves the elements intact
+    data[:] = bytes(len(data))
+    pd.testing.assert_frame_equal(result[0], df)
+    np.testing.assert_array_equal(result[1], np.zeros(1000))
+
+
+def test_buffer_reader_readline():
+    """Test that lines are found across readline's search chunks."""
+    from kissml.serializers import _BufferReader
+
+    reader = _BufferReader(memoryview(b"a" * 1000 + b"\nrest"))
+    assert reader.readline() == b"a" * 1000 + b"\n"
+    assert reader.readline() == b"rest"
+    assert reader.readline() == b""
+
+    # Protocol 0 pickles are read line by line
+    manifest = pickle.dumps([int], protocol=0)
+    element_bytes = pickle.dumps(3)
+    data = manifest + _frame(element_bytes)
+    assert ListSerializer().deserialize(BytesIO(data)) == [3]
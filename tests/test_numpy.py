@@ -0,0 +1,165 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from kissml.core import close_all_caches
+from kissml.settings import settings
+from kissml.step import step
+from kissml.types import CacheConfig
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Clean up cache before and after each test."""
+    # Setup: use temporary directory for tests
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original_cache_dir = settings.cache_directory
+        settings.cache_directory = Path(tmpdir)
+
+        yield
+
+        # Teardown: close all caches and restore original directory
+        close_all_caches()
+        settings.cache_directory = original_cache_dir
+
+
+def test_numpy_arrays_round_trip():
+    """Test that cached arrays round-trip writable and in their layout."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def make_array(n: int, fortran: bool) -> np.ndarray:
+        nonlocal call_count
+        call_count += 1
+        return np.arange(n * 3, dtype=np.float32).reshape(
+            (n, 3), order="F" if fortran else "C"
+        )
+
+    for fortran in (False, True):
+        result1 = make_array(4, fortran)
+        result2 = make_array(4, fortran)
+        np.testing.assert_array_equal(result1, result2)
+        assert result2.dtype == np.float32
+        assert result2.flags.f_contiguous == fortran
+
+        # A view over the fetched file, writable without touching the file
+        assert not result2.flags.owndata
+        result2[0, 0] = -1
+        assert make_array(4, fortran)[0, 0] == 0
+    assert call_count == 2
+
+
+def test_cached_arrays_do_not_hold_file_descriptors(lower_open_file_limit):
+    """Test that holding more cached arrays than the fd limit works."""
+
+    @step(cache=CacheConfig(version=0))
+    def make_array(n: int) -> np.ndarray:
+        return np.full(16, n)
+
+    count = 384
+    for n in range(count):
+        make_array(n)
+
+    lower_open_file_limit(256)
+    held = [make_array(n) for n in range(count)]  # All cache hits
+
+    assert [int(arr[0]) for arr in held] == list(range(count))
+
+
+def test_numpy_object_arrays():
+    """Test that arrays of Python objects round-trip through pickle."""
+    from io import BytesIO
+
+    from kissml.serializers import NumpySerializer
+
+    arr = np.array([{"a": 1}, "two", None], dtype=object)
+
+    buffer = BytesIO()
+    NumpySerializer().serialize(arr, buffer)
+    buffer.seek(0)
+    result = NumpySerializer().deserialize(buffer)
+
+    assert result.dtype == object
+    assert list(result) == list(arr)
+
+
+def test_list_with_numpy_arrays():
+    """Test that arrays in collections round-trip and stay writable."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def return_arrays(n: int) -> list:
+        nonlocal call_count
+        call_count += 1
+        return [np.arange(n), np.ones((n, 2), order="F"), "metadata"]
+
+    result1 = return_arrays(4)
+    result2 = return_arrays(4)
+    assert call_count == 1  # Cache hit
+
+    np.testing.assert_array_equal(result1[0], result2[0])
+    np.testing.assert_array_equal(result1[1], result2[1])
+    assert result2[2] == "metadata"
+
+    # Copied out of the collection's buffer, and writable
+    assert result2[0].flags.owndata
+    result2[0][0] = 10
+    assert result2[0][0] == 10
+
+
+def test_arrays_pickled_by_older_collection_formats():
+    """Test that arrays pickled into version 1 and 2 lists still load."""
+    import pickle
+    from io import BytesIO
+
+    from kissml.serializers import ListSerializer
+
+    arr = np.arange(6).reshape(2, 3)
+
+    # Version 1: the manifest is a bare list of types, elements plain pickles
+    element_bytes = pickle.dumps(arr)
+    data = (
+        pickle.dumps([np.ndarray])
+        + len(element_bytes).to_bytes(8, byteorder="big")
+        + element_bytes
+    )
+    (result,) = ListSerializer().deserialize(BytesIO(data))
+    np.testing.assert_array_equal(result, arr)
+
+    # Version 2: pickles are followed by their out-of-band buffers
+    buffers = []
+    element_bytes = pickle.dumps(
+        arr, protocol=5, buffer_callback=buffers.append
+    )
+    (raw,) = [bytes(buffer.raw()) for buffer in buffers]
+    data = (
+        pickle.dumps((2, [np.ndarray]))
+        + len(element_bytes).to_bytes(8, byteorder="big")
+        + element_bytes
+        + (1).to_bytes(8, byteorder="big")
+        + len(raw).to_bytes(8, byteorder="big")
+        + raw
+    )
+    (result,) = ListSerializer().deserialize(BytesIO(data))
+    np.testing.assert_array_equal(result, arr)
+
+
+def test_array_keys_cover_every_dtype():
+    """Test that datetime and object arrays hash by their full contents."""
+    from kissml.core import create_cache_key
+
+    for dtype in ("M8[s]", "m8[s]"):
+        arr = np.arange(5).astype(dtype)
+        changed = arr.copy()
+        changed[2] = changed[3]
+        key = create_cache_key(arr=arr)
+        assert key == create_cache_key(arr=arr.copy())
+        assert key != create_cache_key(arr=changed)
+
+    # Nested arrays would be truncated by str()
+    nested = np.array([np.zeros(5000), None], dtype=object)
+    changed = np.array([np.zeros(5000), None], dtype=object)
+    changed[0][2500] = 1.0
+    assert create_cache_key(arr=nested) != create_cache_key(arr=changed)
@@ -60,7 +60,7 @@ def test_dataframe_as_cache_key():
 
 
 def test_dataframe_as_return_value():
-    """Test that DataFrames round-trip correctly through Parquet serialization."""
+    """Test that DataFrames round-trip correctly through Arrow IPC serialization."""
     call_count = 0
 
     @step(cache=CacheConfig(version=0))
@@ -295,6 +295,34 @@ def test_dataframe_with_dict_columns():
     assert call_count == 2  # Cache miss
 
 
+def test_dataframe_with_list_columns():
+    """Test that DataFrames with list cells can be hashed for cache keys."""
+    from kissml.core import create_cache_key
+
+    key = create_cache_key(df=pd.DataFrame({"c": [[1, 2], [3]]}))
+    assert key == create_cache_key(df=pd.DataFrame({"c": [[1, 2], [3]]}))
+    assert key != create_cache_key(df=pd.DataFrame({"c": [[1, 2], [4]]}))
+
+    # Series take the same fallback
+    key = create_cache_key(s=pd.Series([[1, 2], [3]]))
+    assert key != create_cache_key(s=pd.Series([[1, 2], [4]]))
+
+
+def test_dataframe_axis_names_are_part_of_the_key():
+    """Test that renaming the index or column axis changes the cache key."""
+    from kissml.core import create_cache_key
+
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    plain = create_cache_key(df=df)
+    index_named = create_cache_key(df=df.rename_axis("id"))
+    columns_named = create_cache_key(df=df.rename_axis("id", axis="columns"))
+
+    assert index_named != plain
+    assert columns_named != plain
+    assert columns_named != index_named
+    assert index_named == create_cache_key(df=df.rename_axis("id"))
+
+
 def test_dataframe_with_array_columns():
     """Test that DataFrames with numpy array columns can be hashed for cache keys."""
     call_count = 0
@@ -399,3 +427,111 @@ def test_dataframe_with_ndarray_column_and_nones():
             np.testing.assert_array_equal(
                 result["matrix"].iloc[i], df["matrix"].iloc[i]
             )
+
+
+def test_dataframe_with_large_array_columns():
+    """Test that large array cells are hashed by content, not by repr."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def process_dataframe_with_arrays(df: pd.DataFrame) -> int:
+        nonlocal call_count
+        call_count += 1
+        return len(df)
+
+    # Arrays this large are abbreviated with "..." by str()
+    features = np.zeros(5000)
+    changed = features.copy()
+    changed[2500] = 1.0
+
+    process_dataframe_with_arrays(pd.DataFrame({"features": [features]}))
+    assert call_count == 1
+
+    process_dataframe_with_arrays(pd.DataFrame({"features": [changed]}))
+    assert call_count == 2  # Cache miss - array contents differ
+
+
+def test_ndarray_column_detection_skips_leading_nones():
+    """Test that ndarray columns are found when they start with missing values."""
+    from kissml.serializers import PandasSerializer
+
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "matrix": [None, np.eye(2), None],
+            "empty": [None, None, None],
+        }
+    )
+
+    assert PandasSerializer().ndarray_columns(df) == ["matrix"]
+    assert PandasSerializer(strict_detection=True).ndarray_columns(df) == [
+        "matrix"
+    ]
+
+
+@pytest.mark.parametrize(
+    "compression, compression_level",
+    [(None, None), ("lz4", None), ("zstd", None), ("zstd", 3)],
+)
+def test_pandas_serializer_compression(compression, compression_level):
+    """Test that DataFrames round-trip with each supported codec."""
+    from io import BytesIO
+
+    from kissml.serializers import PandasSerializer
+
+    df = pd.DataFrame({"a": range(1000), "b": ["x", "y"] * 500})
+
+    buffer = BytesIO()
+    PandasSerializer(
+        compression=compression, compression_level=compression_level
+    ).serialize(df, buffer)
+
+    # Readers detect the codec on their own
+    result = PandasSerializer().deserialize_bytes(
+        memoryview(buffer.getvalue())
+    )
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_large_series_and_arrays_as_cache_keys():
+    """Test that changes hidden by truncated reprs still change the key."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def total(values) -> float:
+        nonlocal call_count
+        call_count += 1
+        return float(values.sum())
+
+    arr = np.zeros(10_000)
+    changed = arr.copy()
+    changed[5_000] = 1.0
+
+    total(arr)
+    total(arr.copy())
+    assert call_count == 1  # Equal arrays share a key
+    total(changed)
+    assert call_count == 2
+
+    total(pd.Series(arr))
+    total(pd.Series(changed))
+    assert call_count == 4
+
+    # Shape and dtype are part of the key
+    total(np.asfortranarray(changed.reshape(100, 100)))
+    total(changed.astype(np.float32))
+    assert call_count == 6
+
+
+def test_series_and_index_names_are_part_of_the_key():
+    """Test that renaming a Series or Index changes its cache key."""
+    from kissml.core import create_cache_key
+
+    index = pd.Index([1, 2])
+    assert create_cache_key(i=index) != create_cache_key(i=index.rename("z"))
+
+    series = pd.Series([1, 2])
+    assert create_cache_key(s=series) != create_cache_key(s=series.rename("z"))
+    assert create_cache_key(s=series) != create_cache_key(
+        s=series.rename_axis("id")
+    )
@@ -1,4 +1,5 @@
 import tempfile
+from collections import namedtuple
 from pathlib import Path
 
 import pytest
@@ -206,6 +207,30 @@ def test_cache_falsy_values():
     assert call_count == 4  # Cache hit
 
 
+Point = namedtuple("Point", ["x", "y"])
+
+
+def test_tuple_subclasses_keep_their_type():
+    """Test that tuple subclasses are pickled rather than cached as tuples."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def make_point(x: int, y: int) -> Point:
+        nonlocal call_count
+        call_count += 1
+        return Point(x, y)
+
+    result1 = make_point(1, 2)
+    assert call_count == 1
+
+    # Cache hit - must still be a Point, not a plain tuple
+    result2 = make_point(1, 2)
+    assert call_count == 1
+    assert type(result2) is Point
+    assert result2 == result1
+    assert result2.x == 1
+
+
 def test_function_with_no_arguments():
     """Test caching works for functions with no arguments."""
     call_count = 0
@@ -385,3 +410,308 @@ def test_close_all_caches():
 
     # Verify caches are cleared
     assert len(_caches) == 0
+
+
+def test_argument_binding_is_validated():
+    """Test that repeated call shapes bind like the first call did."""
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def scale(x: int, /, factor: int = 2, *, offset: int = 0) -> int:
+        nonlocal call_count
+        call_count += 1
+        return x * factor + offset
+
+    assert scale(3) == 6
+    assert scale(4) == 8
+    assert scale(3, 2) == 6
+    assert scale(3, factor=2, offset=0) == 6
+    assert scale(3, offset=1) == 7
+    assert call_count == 3  # Only 4 and offset=1 were new
+
+    # Invalid calls still raise, however often a shape has been seen
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            scale()
+        with pytest.raises(TypeError):
+            scale(3, 2, 1)
+        with pytest.raises(TypeError):
+            scale(x=3)
+
+
+def test_bound_methods_bind_without_self():
+    """Test that decorating a bound method doesn't shift its arguments."""
+
+    class Model:
+        def __init__(self):
+            self.call_count = 0
+
+        def predict(self, a: int) -> int:
+            self.call_count += 1
+            return a * 2
+
+    model = Model()
+    predict = step(cache=CacheConfig(version=0))(model.predict)
+
+    assert predict(1) == 2
+    assert predict(1) == 2
+    assert predict(a=1) == 2
+    assert model.call_count == 1
+
+
+class Features:
+    """Stand-in for an argument that's expensive to hash."""
+
+    def __init__(self, values: list[int]):
+        self.values = values
+
+
+def test_identity_memo_skips_hashing_same_objects():
+    """Test that identity_memo only rehashes arguments that are new objects."""
+    hash_calls = 0
+
+    def hash_features(features: Features) -> str:
+        nonlocal hash_calls
+        hash_calls += 1
+        return str(features.values)
+
+    settings.hash_by_type[Features] = hash_features
+    try:
+
+        @step(cache=CacheConfig(version=0, identity_memo=True))
+        def total(features: Features) -> int:
+            return sum(features.values)
+
+        features = Features([1, 2, 3])
+        assert total(features) == 6
+        assert total(features) == 6
+        assert hash_calls == 1  # Same object, key reused
+
+        # Equal content in a new object is hashed and hits the disk cache
+        assert total(Features([1, 2, 3])) == 6
+        assert hash_calls == 2
+    finally:
+        del settings.hash_by_type[Features]
+
+
+def test_identity_memo_does_not_keep_arguments_alive():
+    """Test that identity_memo only holds weak references to arguments."""
+    import gc
+    import weakref
+
+    settings.hash_by_type[Features] = lambda features: str(features.values)
+    try:
+
+        @step(cache=CacheConfig(version=0, identity_memo=True))
+        def total(features: Features, scale: int) -> int:
+            return sum(features.values) * scale
+
+        refs = []
+        for i in range(50):
+            features = Features([i])
+            refs.append(weakref.ref(features))
+            assert total(features, 2) == 2 * i
+            assert total(features, 2) == 2 * i
+        del features
+        gc.collect()
+        assert all(ref() is None for ref in refs)
+    finally:
+        del settings.hash_by_type[Features]
+
+    # Arguments that can't be weakly referenced are hashed on every call
+    @step(cache=CacheConfig(version=0, identity_memo=True))
+    def length(values: list) -> int:
+        return len(values)
+
+    values = [1, 2]
+    assert length(values) == 2
+    values.append(3)
+    assert length(values) == 3
+
+
+def test_log_messages(caplog):
+    """Test that calls are logged with their duration and cache status."""
+    import logging
+
+    @step(log_level=logging.INFO, cache=CacheConfig(version=0))
+    def double(x: int) -> int:
+        return x * 2
+
+    with caplog.at_level(logging.INFO):
+        double(1)
+        double(1)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert {record.name for record in caplog.records} == {"kissml.step"}
+    assert messages[0].startswith("double completed in ")
+    assert messages[0].endswith(" seconds")
+    assert messages[1].endswith(" seconds (cached)")
+
+
+def test_eviction_policy_is_a_string():
+    """Test that eviction policies are DiskCache's policy names."""
+    assert EvictionPolicy.LEAST_RECENTLY_USED == "least-recently-used"
+    assert isinstance(EvictionPolicy.NONE, str)
+    assert CacheConfig(eviction_policy="none").eviction_policy is (
+        EvictionPolicy.NONE
+    )
+
+
+def test_cache_config_is_validated():
+    """Test that CacheConfig rejects positional and mistyped arguments."""
+    with pytest.raises(TypeError):
+        CacheConfig(1)
+    with pytest.raises(TypeError):
+        CacheConfig(version="2")
+    with pytest.raises(TypeError):
+        CacheConfig(version=True)
+    assert CacheConfig(version=2).version == 2
+
+
+def test_steps_reopen_caches_after_close():
+    """Test that a step keeps working after its cache has been closed."""
+    from kissml.core import _caches
+
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0))
+    def square(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return x * x
+
+    assert square(3) == 9
+    close_all_caches()
+    assert len(_caches) == 0
+
+    # The cache is reopened from disk and still holds the result
+    assert square(3) == 9
+    assert call_count == 1
+    assert len(_caches) == 1
+
+
+def test_jit_compiles_numeric_steps(monkeypatch):
+    """Test that jit=True compiles a numeric step with numba."""
+    numba = pytest.importorskip("numba")
+    from numba.core.dispatcher import Dispatcher
+
+    # Record the dispatchers numba.njit hands back, with or without options.
+    # numba calls it for its own helpers too.
+    dispatchers = []
+    njit = numba.njit
+
+    def record(result):
+        if isinstance(result, Dispatcher):
+            dispatchers.append(result)
+            return result
+        return lambda func: record(result(func))
+
+    monkeypatch.setattr(numba, "njit", lambda *a, **kw: record(njit(*a, **kw)))
+
+    @step(jit=True, cache=CacheConfig(version=0))
+    def sum_of_squares(n: int) -> int:
+        total = 0
+        for i in range(n):
+            total += i * i
+        return total
+
+    assert sum_of_squares(10) == 285
+    assert sum_of_squares(10) == 285  # Cache hit
+    assert sum_of_squares(11) == 385
+
+    # The step's compiled dispatcher ran, specialized for integer arguments
+    (compiled,) = [
+        d for d in dispatchers if d.py_func.__name__ == "sum_of_squares"
+    ]
+    assert [str(sig) for sig in compiled.signatures] == ["(int64,)"]
+
+
+def test_jit_falls_back_to_python():
+    """Test that jit=True still runs functions numba can't compile."""
+
+    @step(jit=True)
+    def describe(values: dict) -> str:
+        return ", ".join(f"{k}={v}" for k, v in sorted(values.items()))
+
+    assert describe({"b": 2, "a": 1}) == "a=1, b=2"
+    assert describe({"c": 3}) == "c=3"
+
+
+def test_cache_digest():
+    """Test that cache keys are stable digests of version and arguments."""
+    from kissml.core import create_cache_digest
+
+    key = create_cache_digest(1, a=1, b="test")
+    assert isinstance(key, bytes)
+    assert key == create_cache_digest(1, b="test", a=1)
+    assert key != create_cache_digest(2, a=1, b="test")
+    assert key != create_cache_digest(1, a=2, b="test")
+
+    # Arguments may share a name with the version parameter
+    assert create_cache_digest(1, version=2) != create_cache_digest(1)
+
+
+def test_batch_calls(monkeypatch):
+    """Test that batch calls look up results and store them together."""
+    calls = []
+
+    from diskcache import Cache
+
+    # Only stores should take the write lock a transaction holds
+    transactions = []
+    transact = Cache.transact
+
+    def counting_transact(self, *args, **kwargs):
+        transactions.append(args)
+        return transact(self, *args, **kwargs)
+
+    monkeypatch.setattr(Cache, "transact", counting_transact)
+
+    @step(cache=CacheConfig(version=0))
+    def power(base: int, exponent: int = 2) -> int:
+        calls.append((base, exponent))
+        return base**exponent
+
+    assert power(2) == 4
+    calls.clear()
+
+    results = power.batch([(1,), (2,), (3, 3), (1,)])
+    assert results == [1, 4, 27, 1]
+    assert calls == [(1, 2), (3, 3)]  # 2 was cached; (1,) repeats
+    assert len(transactions) == 1
+
+    # The batch stored its results for regular calls
+    calls.clear()
+    assert power(3, 3) == 27
+    assert power.batch([(1,)]) == [1]
+    assert calls == []
+    assert len(transactions) == 1  # Hits don't open a transaction
+
+    @step()
+    def increment(x: int) -> int:
+        return x + 1
+
+    assert increment.batch([(1,), (2,)]) == [2, 3]
+
+
+def test_cache_warmup():
+    """Test that warmed caches are opened ahead of the first call."""
+    from kissml.core import _caches, _warmups
+
+    call_count = 0
+
+    @step(cache=CacheConfig(version=0, warmup=True))
+    def negate(x: int) -> int:
+        nonlocal call_count
+        call_count += 1
+        return -x
+
+    for future in list(_warmups):
+        future.result()
+    assert len(_caches) == 1
+
+    assert negate(1) == -1
+    assert negate(1) == -1
+    assert call_count == 1
+    assert len(_caches) == 1  # The call used the warmed cache